@@ -3,7 +3,10 @@ duckdb-tinyorm-py: A tiny ORM for DuckDB in Python
 """
 
 from .repository import DuckDbRepository, BaseRepository, QueryBuilder
-from .decorators import entity, id_field, field, repository, index, get_entity_metadata
+from .decorators import (
+    entity, id_field, field, FieldMeta, repository, index,
+    get_entity_metadata, EntityDescriptor
+)
 from .config import DuckDbLocation, DuckDbConfig
 from .exceptions import DuckDbOrmError, EntityNotFoundError, ValidationError, InvalidQueryError
 
@@ -17,9 +20,11 @@ __all__ = [
     'entity',
     'id_field',
     'field', 
+    'FieldMeta',
     'repository',
     'index',
     'get_entity_metadata',
+    'EntityDescriptor',
     
     # Configuration
     'DuckDbLocation',
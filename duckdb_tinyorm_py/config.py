@@ -20,7 +20,8 @@ class DuckDbConfig:
                  filename: Optional[str] = None,
                  settings: Dict[str, Any] = None,
                  load_extensions: bool = False,
-                 extensions: Optional[list] = None):
+                 extensions: Optional[list] = None,
+                 pool_size: int = 4):
         """
         Initialize DuckDB configuration
         
@@ -31,6 +32,7 @@ class DuckDbConfig:
             settings: DuckDB configuration settings
             load_extensions: Whether to load extensions
             extensions: List of extensions to load
+            pool_size: Number of pooled cursors used for concurrent async reads
         """
         self.name = name
         self.location = location
@@ -38,10 +40,13 @@ class DuckDbConfig:
         self.settings = settings or {}
         self.load_extensions = load_extensions
         self.extensions = extensions or []
+        self.pool_size = pool_size
         
         # Validate config
         if self.location == DuckDbLocation.FILE and not self.filename:
             raise ValueError("Filename must be provided for FILE location")
+        if self.pool_size < 1:
+            raise ValueError("pool_size must be at least 1")
 
 
 class Index:
@@ -1,8 +1,11 @@
 """
 Decorator module for entity and field definitions with additional features
 """
-from typing import Type, TypeVar, Generic, Dict, Any, List, Optional, get_type_hints, Union
+from typing import Type, TypeVar, Generic, Dict, Any, List, Optional, Tuple, NamedTuple, get_type_hints, Union
 import inspect
+import json
+import keyword
+import sys
 from enum import Enum
 
 # Entity and field registry
@@ -12,6 +15,73 @@ _REPOSITORY_REGISTRY = {}
 T = TypeVar('T')
 
 
+class EntityDescriptor(NamedTuple):
+    """Immutable column layout and pre-built SQL statements for an entity"""
+    table_name: str
+    field_names: Tuple[str, ...]
+    sql_types: Tuple[str, ...]
+    id_field: Optional[str]
+    id_index: Optional[int]
+    select_sql: str
+    insert_sql: str
+    insert_row_sql: str
+    next_id_sql: Optional[str]
+    next_ids_sql: Optional[str]
+    find_by_id_sql: Optional[str]
+    exists_by_id_sql: Optional[str]
+    update_sql: Optional[str]
+    update_returning_sql: Optional[str]
+    delete_by_id_sql: Optional[str]
+
+
+def build_entity_descriptor(cls) -> Optional[EntityDescriptor]:
+    """Build the EntityDescriptor for an entity class from its field metadata"""
+    meta = get_entity_metadata(cls)
+    if not meta or not meta['fields']:
+        return None
+
+    table = meta['table_name']
+    fields = meta['fields']
+    field_names = tuple(fields)
+    id_field = meta['id_field']
+    columns = ', '.join(field_names)
+    insert_row_sql = f"({', '.join('?' for _ in field_names)})"
+
+    find_by_id_sql = exists_by_id_sql = update_sql = update_returning_sql = delete_by_id_sql = None
+    if id_field:
+        where_id = f"WHERE {id_field} = ?"
+        updates = ', '.join(f"{name} = ?" for name in field_names if name != id_field)
+        find_by_id_sql = f"SELECT {columns} FROM {table} {where_id} LIMIT 1"
+        exists_by_id_sql = f"SELECT 1 FROM {table} {where_id} LIMIT 1"
+        update_sql = f"UPDATE {table} SET {updates} {where_id}"
+        update_returning_sql = f"{update_sql} RETURNING {columns}"
+        delete_by_id_sql = f"DELETE FROM {table} {where_id}"
+
+    auto_increment = any(f.get('auto_increment', False) for f in fields.values())
+
+    # Intern the statements so every repository shares one string object per statement
+    def _intern(sql):
+        return sys.intern(sql) if sql else None
+
+    return EntityDescriptor(
+        table_name=table,
+        field_names=tuple(sys.intern(name) for name in field_names),
+        sql_types=tuple(f['type'] for f in fields.values()),
+        id_field=id_field,
+        id_index=field_names.index(id_field) if id_field else None,
+        select_sql=_intern(f"SELECT {columns} FROM {table}"),
+        insert_sql=_intern(f"INSERT INTO {table} ({columns}) VALUES {insert_row_sql}"),
+        insert_row_sql=_intern(insert_row_sql),
+        next_id_sql=_intern(f"SELECT nextval('seq_{table}')" if auto_increment else None),
+        next_ids_sql=_intern(f"SELECT nextval('seq_{table}') FROM range(?)" if auto_increment else None),
+        find_by_id_sql=_intern(find_by_id_sql),
+        exists_by_id_sql=_intern(exists_by_id_sql),
+        update_sql=_intern(update_sql),
+        update_returning_sql=_intern(update_returning_sql),
+        delete_by_id_sql=_intern(delete_by_id_sql)
+    )
+
+
 def entity(cls=None, *, table_name: Optional[str] = None):
     """
     Decorator to mark a class as a database entity.
@@ -51,6 +121,9 @@ def entity(cls=None, *, table_name: Optional[str] = None):
         # This will trigger the scan in get_entity_metadata if needed
         cls._get_entity_meta = lambda: get_entity_metadata(cls)
 
+        # Pre-build the column layout and SQL statements once per class
+        cls.__entity__ = build_entity_descriptor(cls)
+
         return cls
 
     if cls is None:
@@ -126,6 +199,49 @@ def id_field(data_type: str = 'INTEGER', *, auto_increment: bool = False):
     return decorator
 
 
+class FieldMeta:
+    """
+    Declarative field definition for entities that store their fields as
+    plain attributes (e.g. via __slots__) instead of decorated properties.
+
+    Declare them in a class-level ``_fields`` dict, in column order::
+
+        _fields = {'id': FieldMeta('INTEGER', is_id=True), 'name': FieldMeta('VARCHAR')}
+    """
+
+    def __init__(self, data_type: str = None, *,
+                 is_id: bool = False,
+                 auto_increment: bool = False,
+                 not_null: bool = False,
+                 unique: bool = False,
+                 default: Any = None,
+                 comment: str = None):
+        self.data_type = data_type
+        self.is_id = is_id
+        self.auto_increment = auto_increment
+        self.not_null = not_null
+        self.unique = unique
+        self.default = default
+        self.comment = comment
+
+    def to_field_meta(self) -> Dict[str, Any]:
+        """Convert to the temporary metadata format used by @field / @id_field"""
+        if self.is_id:
+            return {
+                'decorator': 'id_field',
+                'data_type': self.data_type or 'INTEGER',
+                'auto_increment': self.auto_increment
+            }
+        return {
+            'decorator': 'field',
+            'data_type': self.data_type,
+            'not_null': self.not_null,
+            'unique': self.unique,
+            'default': self.default,
+            'comment': self.comment
+        }
+
+
 def index(fields: Union[str, List[str]], *,
           name: Optional[str] = None,
           unique: bool = False,
@@ -154,6 +270,42 @@ def index(fields: Union[str, List[str]], *,
     return decorator
 
 
+def _load_json(value):
+    """Decode a JSON column value, leaving it untouched if it is not valid JSON."""
+    if isinstance(value, str):
+        try:
+            return json.loads(value)
+        except ValueError:
+            pass
+    return value
+
+
+def _compile_hydrator(entity_cls):
+    """
+    Generate a function that converts a full table row (columns in field order)
+    into an entity, with one attribute assignment per column and no metadata
+    lookups. Returns None if the entity's fields cannot be expressed that way.
+    """
+    meta = get_entity_metadata(entity_cls)
+    if not meta or not meta['fields']:
+        return None
+
+    func_name = f"_hydrate_{entity_cls.__name__}"
+    lines = [f"def {func_name}(row):", "    entity = entity_cls()"]
+    for i, (field_name, field_meta) in enumerate(meta['fields'].items()):
+        if not field_name.isidentifier() or keyword.iskeyword(field_name):
+            return None
+        value = f"row[{i}]"
+        if field_meta.get('python_type') == 'dict':
+            value = f"_load_json({value})"
+        lines.append(f"    entity.{field_name} = {value}")
+    lines.append("    return entity")
+
+    namespace = {'entity_cls': entity_cls, '_load_json': _load_json}
+    exec(compile("\n".join(lines), f"<hydrator {entity_cls.__name__}>", 'exec'), namespace)
+    return namespace[func_name]
+
+
 def repository(entity_cls):
     """
     Decorator to associate a repository with an entity. Applied to the repository class.
@@ -164,6 +316,8 @@ def repository(entity_cls):
             'class': repo_cls, 'entity': entity_key
         }
         repo_cls._entity_class = entity_cls
+        hydrator = _compile_hydrator(entity_cls)
+        repo_cls._hydrate = staticmethod(hydrator) if hydrator else None
         repo_cls._get_registry_info = lambda: _REPOSITORY_REGISTRY[repo_cls.__name__]
         return repo_cls
     return decorator
@@ -199,70 +353,79 @@ def get_entity_metadata(cls_or_name):
              # Handle cases where getting class hints might fail
              pass
 
-         for name, member in inspect.getmembers(cls):
-             # Check if the member is a property getter with our temporary metadata
-             if hasattr(member, 'fget') and hasattr(member.fget, '_field_meta'):
-                 method = member.fget # Get the original decorated method from property
-                 field_meta_info = getattr(method, '_field_meta', None)
-                 if not field_meta_info: continue # Skip if no metadata found
-
-                 decorator_type = field_meta_info['decorator']
-                 field_name = name # The name of the property
-
-                 # Get Python type hint from the method's return annotation or class hint
-                 python_type = None
-                 try:
-                     method_hints = get_type_hints(method)
-                     python_type = method_hints.get('return')
-                 except Exception: # Fallback to class hints if method hints fail
-                     python_type = all_hints.get(field_name)
-
-                 python_type_name = None
-                 if python_type:
-                     origin = getattr(python_type, '__origin__', None)
-                     args = getattr(python_type, '__args__', ())
-                     if origin is Union and type(None) in args:
-                         non_none = [a for a in args if a is not type(None)]
-                         if len(non_none) == 1:
-                             base_type = non_none[0]
-                             python_type_name = getattr(base_type, '__name__', str(base_type))
-                         else: python_type_name = str(python_type) # Handle complex Unions
-                     else:
-                         python_type_name = getattr(python_type, '__name__', str(python_type))
-
-                 # Determine SQL type
-                 sql_type = field_meta_info.get('data_type')
-                 if sql_type is None and python_type:
-                     sql_type = _get_sql_type_from_python_type(python_type)
-                 elif sql_type is None: # Default SQL type if not specified and hint unavailable
-                     sql_type = 'INTEGER' if decorator_type == 'id_field' else 'VARCHAR'
-
-                 # Build the metadata dictionary for this field
-                 current_field_meta = {
-                     'name': field_name,
-                     'type': sql_type.upper(),
-                     'python_type': python_type_name,
-                     'is_id': False, 'not_null': False, 'unique': False,
-                     'default': None, 'comment': None, 'auto_increment': False
-                 }
-
-                 if decorator_type == 'id_field':
-                     current_field_meta.update({
-                         'is_id': True, 'not_null': True, 'unique': True,
-                         'auto_increment': field_meta_info.get('auto_increment', False),
-                         'type': (field_meta_info.get('data_type') or 'INTEGER').upper() # Use specified or default ID type
-                     })
-                     meta['id_field'] = field_name # Set the primary key field name
-                 elif decorator_type == 'field':
-                     current_field_meta.update({
-                         'not_null': field_meta_info.get('not_null', False),
-                         'unique': field_meta_info.get('unique', False),
-                         'default': field_meta_info.get('default'),
-                         'comment': field_meta_info.get('comment'),
-                         'type': sql_type.upper() # Ensure type is stored
-                     })
-
-                 meta['fields'][field_name] = current_field_meta
+         # Collect (name, temporary metadata, python type) for every field, either
+         # from a declarative _fields dict or from decorated property getters
+         declared_fields = []
+         if isinstance(cls.__dict__.get('_fields'), dict):
+             for field_name, field_def in cls.__dict__['_fields'].items():
+                 declared_fields.append((field_name, field_def.to_field_meta(), all_hints.get(field_name)))
+         else:
+             for name, member in inspect.getmembers(cls):
+                 # Check if the member is a property getter with our temporary metadata
+                 if hasattr(member, 'fget') and hasattr(member.fget, '_field_meta'):
+                     method = member.fget # Get the original decorated method from property
+                     field_meta_info = getattr(method, '_field_meta', None)
+                     if not field_meta_info: continue # Skip if no metadata found
+
+                     # Get Python type hint from the method's return annotation or class hint
+                     python_type = None
+                     try:
+                         method_hints = get_type_hints(method)
+                         python_type = method_hints.get('return')
+                     except Exception: # Fallback to class hints if method hints fail
+                         python_type = all_hints.get(name)
+
+                     declared_fields.append((name, field_meta_info, python_type))
+
+         for field_name, field_meta_info, python_type in declared_fields:
+             decorator_type = field_meta_info['decorator']
+
+             python_type_name = None
+             if python_type:
+                 origin = getattr(python_type, '__origin__', None)
+                 args = getattr(python_type, '__args__', ())
+                 if origin is Union and type(None) in args:
+                     non_none = [a for a in args if a is not type(None)]
+                     if len(non_none) == 1:
+                         base_type = non_none[0]
+                         python_type_name = getattr(base_type, '__name__', str(base_type))
+                     else: python_type_name = str(python_type) # Handle complex Unions
+                 else:
+                     python_type_name = getattr(python_type, '__name__', str(python_type))
+
+             # Determine SQL type
+             sql_type = field_meta_info.get('data_type')
+             if sql_type is None and python_type:
+                 sql_type = _get_sql_type_from_python_type(python_type)
+             elif sql_type is None: # Default SQL type if not specified and hint unavailable
+                 sql_type = 'INTEGER' if decorator_type == 'id_field' else 'VARCHAR'
+
+             # Build the metadata dictionary for this field
+             current_field_meta = {
+                 'name': field_name,
+                 'type': sql_type.upper(),
+                 'python_type': python_type_name,
+                 'is_id': False, 'not_null': False, 'unique': False,
+                 'default': None, 'comment': None, 'auto_increment': False
+             }
+
+             if decorator_type == 'id_field':
+                 current_field_meta.update({
+                     'is_id': True, 'not_null': True, 'unique': True,
+                     'auto_increment': field_meta_info.get('auto_increment', False),
+                     'type': (field_meta_info.get('data_type') or 'INTEGER').upper() # Use specified or default ID type
+                 })
+                 meta['id_field'] = field_name # Set the primary key field name
+             elif decorator_type == 'field':
+                 current_field_meta.update({
+                     'not_null': field_meta_info.get('not_null', False),
+                     'unique': field_meta_info.get('unique', False),
+                     'default': field_meta_info.get('default'),
+                     'comment': field_meta_info.get('comment'),
+                     'type': sql_type.upper() # Ensure type is stored
+                 })
+
+             meta['fields'][field_name] = current_field_meta
 
          meta['_fields_processed'] = True # Mark fields as processed
 
@@ -19,7 +19,10 @@ class Migration:
         self.created_at = datetime.now().isoformat()
     
     async def up(self, db: DuckDbRepository):
-        """Apply migration"""
+        """
+        Apply migration. To insert bootstrap data, bind all rows in one call with
+        db.executemany(sql, rows) rather than calling db.execute once per row.
+        """
         raise NotImplementedError("Subclasses must implement up()")
     
     async def down(self, db: DuckDbRepository):
@@ -141,21 +144,96 @@ class MigrationManager:
             print(f"Revert of migration {migration.name} (v{migration.version}) failed: {str(e)}")
             raise
     
+    async def _get_applied_keys(self) -> set:
+        """Get (name, version) pairs of already applied migrations"""
+        sql = f"SELECT name, version FROM {self.migrations_table}"
+        return {(row[0], row[1]) for row in self.db.execute_and_fetch(sql)}
+    
     async def apply_migrations(self, migrations: List[Migration]) -> int:
-        """Apply multiple migrations in order"""
-        count = 0
+        """
+        Apply multiple migrations in order, in a single transaction.
+        If any migration fails, none of the batch is applied.
+        """
+        if not self.initialized:
+            await self.init()
+        
+        applied = await self._get_applied_keys()
+        pending = []
         for migration in migrations:
-            if await self.apply_migration(migration):
-                count += 1
-        return count
+            key = (migration.name, migration.version)
+            if key in applied:
+                print(f"Migration {migration.name} (v{migration.version}) already applied")
+                continue
+            applied.add(key)
+            pending.append(migration)
+        
+        if not pending:
+            return 0
+        
+        try:
+            self.db.begin_transaction()
+            
+            for migration in pending:
+                await migration.up(self.db)
+            
+            # Record all migrations with one multi-row insert
+            values_str = ", ".join("(?, ?, CURRENT_TIMESTAMP)" for _ in pending)
+            sql = f"INSERT INTO {self.migrations_table} (name, version, applied_at) VALUES {values_str}"
+            params = [value for m in pending for value in (m.name, m.version)]
+            self.db.execute(sql, params)
+            
+            self.db.commit()
+        except Exception as e:
+            self.db.rollback()
+            print(f"Migration batch failed, no migrations applied: {str(e)}")
+            raise
+        
+        for migration in pending:
+            print(f"Applied migration {migration.name} (v{migration.version})")
+        return len(pending)
     
     async def revert_migrations(self, migrations: List[Migration]) -> int:
-        """Revert multiple migrations in reverse order"""
-        count = 0
+        """
+        Revert multiple migrations in reverse order, in a single transaction.
+        If any revert fails, none of the batch is reverted.
+        """
+        if not self.initialized:
+            await self.init()
+        
+        applied = await self._get_applied_keys()
+        pending = []
         for migration in reversed(migrations):
-            if await self.revert_migration(migration):
-                count += 1
-        return count
+            key = (migration.name, migration.version)
+            if key not in applied:
+                print(f"Migration {migration.name} (v{migration.version}) was not applied")
+                continue
+            applied.discard(key)
+            pending.append(migration)
+        
+        if not pending:
+            return 0
+        
+        try:
+            self.db.begin_transaction()
+            
+            for migration in pending:
+                await migration.down(self.db)
+            
+            # Remove all migration records with one statement
+            keys_str = ", ".join("(?, ?)" for _ in pending)
+            sql = f"DELETE FROM {self.migrations_table} WHERE (name, version) IN ({keys_str})"
+            params = [value for m in pending for value in (m.name, m.version)]
+            self.db.execute(sql, params)
+            
+            self.db.commit()
+        except Exception as e:
+            self.db.rollback()
+            print(f"Revert of migration batch failed, no migrations reverted: {str(e)}")
+            raise
+        
+        for migration in pending:
+            print(f"Reverted migration {migration.name} (v{migration.version})")
+        return len(pending)
     
     @staticmethod
     def create_migration_file(name: str, directory: str = "migrations") -> str:
@@ -1,21 +1,49 @@
 """
 Repository module for database operations with extended ORM features
 """
-from typing import TypeVar, Generic, Dict, Any, List, Optional, Type, Union, Callable
+from typing import TypeVar, Generic, Dict, Any, List, Optional, Type, Union, Callable, TYPE_CHECKING
 import duckdb
-import pandas as pd
-import numpy as np
 import json
+import os
 from datetime import datetime, date
 import asyncio
-from .decorators import get_entity_metadata
+import queue
+import threading
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+from .decorators import get_entity_metadata, build_entity_descriptor, EntityDescriptor
 from .config import DuckDbLocation, DuckDbConfig
 from .exceptions import EntityNotFoundError, InvalidQueryError
 
+# pandas is only needed once a DataFrame is requested (DuckDB imports it for .df()),
+# so it is not imported at module load to keep startup fast
+if TYPE_CHECKING:
+    import pandas as pd
+
 T = TypeVar('T')
 K = TypeVar('K')
 
 
+# Leading keywords of statements that open or close a transaction
+_TRANSACTION_START_KEYWORDS = frozenset({'BEGIN', 'START'})
+_TRANSACTION_END_KEYWORDS = frozenset({'COMMIT', 'END', 'ROLLBACK', 'ABORT'})
+
+
+# Parquet codecs accepted by COPY ... (FORMAT PARQUET, COMPRESSION ...)
+_PARQUET_COMPRESSIONS = frozenset({'uncompressed', 'snappy', 'gzip', 'zstd', 'brotli', 'lz4', 'lz4_raw'})
+
+
+def _fetch_rows(result):
+    """Fetch a DuckDB result as a list of row tuples"""
+    return result.fetchall()
+
+
+def _to_arrow_table(result):
+    """Fetch a DuckDB result as an Arrow table (newer DuckDB returns a RecordBatchReader)"""
+    arrow = result.arrow()
+    return arrow.read_all() if hasattr(arrow, 'read_all') else arrow
+
+
 class DuckDbRepository:
     """DuckDB repository for managing database connections"""
     
@@ -39,6 +67,12 @@ class DuckDbRepository:
         """Initialize the repository with configuration"""
         self.config = config
         self.con = None
+        self._pool = None
+        self._executor = None
+        self._in_transaction = False
+        # A DuckDB connection keeps only its latest result, so the main connection
+        # must be used by one thread at a time
+        self._con_lock = threading.RLock()
         self._init_connection()
     
     def _init_connection(self):
@@ -48,64 +82,203 @@ class DuckDbRepository:
         else:
             self.con = duckdb.connect(database=self.config.filename)
         
-        # Apply any custom settings
+        self._apply_settings(self.con)
+        
+        if self.config.load_extensions:
+            for extension in self.config.extensions:
+                self.con.execute(f"INSTALL {extension}")
+        self._load_extensions(self.con)
+        
+        # Pool of cursors on the same database for concurrent async reads.
+        # Each cursor is its own DuckDB connection, so they can run in parallel.
+        pool_size = getattr(self.config, 'pool_size', 4)
+        self._pool = queue.Queue(maxsize=pool_size)
+        for _ in range(pool_size):
+            cursor = self.con.cursor()
+            self._apply_settings(cursor)
+            self._load_extensions(cursor)
+            self._pool.put_nowait(cursor)
+        
+        # Dedicated worker threads for async calls, one per pooled cursor
+        self._executor = ThreadPoolExecutor(max_workers=pool_size,
+                                            thread_name_prefix=f"duckdb-{self.config.name}")
+    
+    def _apply_settings(self, con):
+        """Apply the configured settings on a connection (many are session-scoped)"""
         if hasattr(self.config, 'settings') and self.config.settings:
             for setting, value in self.config.settings.items():
-                self.con.execute(f"SET {setting}={value}")
+                con.execute(f"SET {setting}={value}")
     
-    def execute(self, sql: str, params: Optional[Dict[str, Any]] = None):
-        """Execute a SQL query"""
+    def _load_extensions(self, con):
+        """Load the configured extensions on a connection"""
+        if self.config.load_extensions:
+            for extension in self.config.extensions:
+                con.execute(f"LOAD {extension}")
+    
+    def _fetch_pooled(self, sql: str, params=None, fetch: Callable = _fetch_rows):
+        """Run a query on a pooled cursor and convert the result with fetch (blocking)"""
+        # Uncommitted changes are only visible on the main connection
+        if self._in_transaction:
+            with self._con_lock:
+                if self._in_transaction:
+                    return self._fetch_on(self.con, sql, params, fetch)
+        cursor = self._pool.get()
+        try:
+            return self._fetch_on(cursor, sql, params, fetch)
+        finally:
+            self._pool.put_nowait(cursor)
+    
+    @staticmethod
+    def _fetch_on(con, sql: str, params, fetch: Callable):
+        """Run a query on the given connection and convert the result with fetch"""
         try:
             if params:
-                return self.con.execute(sql, params)
-            return self.con.execute(sql)
+                return fetch(con.execute(sql, params))
+            return fetch(con.execute(sql))
         except Exception as e:
             raise InvalidQueryError(f"Error executing query: {sql}. Error: {str(e)}")
     
+    def _track_transaction(self, sql: str):
+        """
+        Note transactions opened or closed with raw SQL, so reads stay on the main
+        connection (the only one that sees uncommitted changes) until they end.
+        """
+        words = sql.split(None, 1)
+        if not words:
+            return
+        keyword = words[0].rstrip(';').upper()
+        if keyword in _TRANSACTION_START_KEYWORDS:
+            self._in_transaction = True
+        elif keyword in _TRANSACTION_END_KEYWORDS:
+            self._in_transaction = False
+    
+    def execute(self, sql: str, params: Optional[Dict[str, Any]] = None):
+        """Execute a SQL query"""
+        with self._con_lock:
+            try:
+                if params:
+                    result = self.con.execute(sql, params)
+                else:
+                    result = self.con.execute(sql)
+            except Exception as e:
+                raise InvalidQueryError(f"Error executing query: {sql}. Error: {str(e)}")
+            self._track_transaction(sql)
+            return result
+    
+    def executemany(self, sql: str, seq_of_params: List[List[Any]]):
+        """Execute a SQL statement once for each parameter set (e.g. bulk inserts)"""
+        with self._con_lock:
+            try:
+                return self.con.executemany(sql, seq_of_params)
+            except Exception as e:
+                raise InvalidQueryError(f"Error executing query: {sql}. Error: {str(e)}")
+    
     def execute_and_fetch(self, sql: str, params: Optional[Dict[str, Any]] = None):
         """Execute a SQL query and fetch results"""
-        try:
-            if params:
-                return self.con.execute(sql, params).fetchall()
-            return self.con.execute(sql).fetchall()
-        except Exception as e:
-            raise InvalidQueryError(f"Error executing query: {sql}. Error: {str(e)}")
+        with self._con_lock:
+            try:
+                if params:
+                    rows = self.con.execute(sql, params).fetchall()
+                else:
+                    rows = self.con.execute(sql).fetchall()
+            except Exception as e:
+                raise InvalidQueryError(f"Error executing query: {sql}. Error: {str(e)}")
+            self._track_transaction(sql)
+            return rows
     
-    def query(self, sql: str, params: Optional[Dict[str, Any]] = None) -> pd.DataFrame:
+    async def execute_and_fetch_async(self, sql: str, params: Optional[Dict[str, Any]] = None):
+        """
+        Execute a SQL query on a pooled cursor in a worker thread and fetch results.
+        Independent calls awaited together (e.g. with asyncio.gather) run concurrently.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self._fetch_pooled, sql, params)
+    
+    async def query_async(self, sql: str, params: Optional[Dict[str, Any]] = None) -> 'pd.DataFrame':
+        """Run a query on a pooled cursor in a worker thread and return a pandas DataFrame"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self._fetch_pooled, sql, params,
+                                          lambda result: result.df())
+    
+    async def query_arrow_async(self, sql: str, params: Optional[Dict[str, Any]] = None):
+        """Run a query on a pooled cursor in a worker thread and return an Arrow table"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self._fetch_pooled, sql, params,
+                                          _to_arrow_table)
+    
+    async def execute_async(self, sql: str, params: Optional[Dict[str, Any]] = None):
+        """
+        Execute a SQL statement on the main connection in a worker thread, so the
+        event loop keeps running while DuckDB does the work. Calls on the main
+        connection are serialized. Returns any rows the statement produces (e.g.
+        from a RETURNING clause).
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self.execute_and_fetch, sql, params)
+    
+    def query(self, sql: str, params: Optional[Dict[str, Any]] = None) -> 'pd.DataFrame':
         """Run a query and return a pandas DataFrame"""
-        try:
-            if params:
-                return self.con.execute(sql, params).df()
-            return self.con.execute(sql).df()
-        except Exception as e:
-            raise InvalidQueryError(f"Error executing query: {sql}. Error: {str(e)}")
+        with self._con_lock:
+            try:
+                if params:
+                    return self.con.execute(sql, params).df()
+                return self.con.execute(sql).df()
+            except Exception as e:
+                raise InvalidQueryError(f"Error executing query: {sql}. Error: {str(e)}")
     
     def query_arrow(self, sql: str, params: Optional[Dict[str, Any]] = None):
         """Run a query and return an Arrow table"""
-        try:
-            if params:
-                return self.con.execute(sql, params).arrow()
-            return self.con.execute(sql).arrow()
-        except Exception as e:
-            raise InvalidQueryError(f"Error executing query: {sql}. Error: {str(e)}")
+        with self._con_lock:
+            try:
+                if params:
+                    return _to_arrow_table(self.con.execute(sql, params))
+                return _to_arrow_table(self.con.execute(sql))
+            except Exception as e:
+                raise InvalidQueryError(f"Error executing query: {sql}. Error: {str(e)}")
+    
+    def register(self, view_name: str, python_object):
+        """Register a DataFrame or Arrow table as a virtual view on the main connection"""
+        with self._con_lock:
+            self.con.register(view_name, python_object)
+    
+    def unregister(self, view_name: str):
+        """Remove a view registered with register()"""
+        with self._con_lock:
+            self.con.unregister(view_name)
     
     def close(self):
         """Close the database connection"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        if self._pool is not None:
+            while not self._pool.empty():
+                self._pool.get_nowait().close()
+            self._pool = None
         if self.con:
             self.con.close()
             self.con = None
+        # Forget the shared handle so get_instance() opens a fresh connection
+        if DuckDbRepository._instances.get(self.config.name) is self:
+            del DuckDbRepository._instances[self.config.name]
     
     def begin_transaction(self):
         """Begin a transaction"""
-        self.con.execute("BEGIN TRANSACTION")
+        with self._con_lock:
+            self.con.execute("BEGIN TRANSACTION")
+            self._in_transaction = True
     
     def commit(self):
         """Commit the current transaction"""
-        self.con.execute("COMMIT")
+        with self._con_lock:
+            self.con.execute("COMMIT")
+            self._in_transaction = False
     
     def rollback(self):
         """Rollback the current transaction"""
-        self.con.execute("ROLLBACK")
+        with self._con_lock:
+            self.con.execute("ROLLBACK")
+            self._in_transaction = False
     
     def __enter__(self):
         """Context manager entry"""
@@ -124,6 +297,57 @@ class DuckDbRepository:
                 raise
 
 
+@lru_cache(maxsize=256)
+def _build_select_sql(table_name, select_fields, join_clauses, where_clauses,
+                      group_by_clauses, having_clauses, order_by_clauses,
+                      limit_value, offset_value) -> str:
+    """Assemble a SELECT statement from QueryBuilder clauses"""
+    select_clause = f"SELECT {', '.join(select_fields)}"
+    from_clause = f"FROM {table_name}"
+    
+    # Add JOIN clauses
+    join_clause = " ".join(join_clauses) if join_clauses else ""
+    
+    # Add WHERE clause
+    where_clause = ""
+    if where_clauses:
+        where_clause = "WHERE " + " AND ".join(where_clauses)
+    
+    # Add GROUP BY clause
+    group_by_clause = ""
+    if group_by_clauses:
+        group_by_clause = "GROUP BY " + ", ".join(group_by_clauses)
+    
+    # Add HAVING clause
+    having_clause = ""
+    if having_clauses:
+        having_clause = "HAVING " + " AND ".join(having_clauses)
+    
+    # Add ORDER BY clause
+    order_by_clause = ""
+    if order_by_clauses:
+        order_by_clause = "ORDER BY " + ", ".join(order_by_clauses)
+    
+    # Add LIMIT and OFFSET
+    limit_clause = f"LIMIT {limit_value}" if limit_value is not None else ""
+    offset_clause = f"OFFSET {offset_value}" if offset_value is not None else ""
+    
+    # Build the final query
+    clauses = [
+        select_clause,
+        from_clause,
+        join_clause,
+        where_clause,
+        group_by_clause,
+        having_clause,
+        order_by_clause,
+        limit_clause,
+        offset_clause
+    ]
+    
+    return " ".join(clause for clause in clauses if clause)
+
+
 class QueryBuilder:
     """SQL query builder to simplify complex query construction"""
     
@@ -136,7 +360,7 @@ class QueryBuilder:
         self.having_clauses = []
         self.limit_value = None
         self.offset_value = None
-        self.params = {}
+        self.params = []
         self.join_clauses = []
     
     def select(self, *fields):
@@ -151,10 +375,9 @@ class QueryBuilder:
             value = operator
             operator = "="
         
-        # Use ? placeholder instead of named parameter
+        # Use ? placeholder and collect values in order
         self.where_clauses.append(f"{field} {operator} ?")
-        # Still collect values in order
-        self.params[f"param_{len(self.params)}"] = value
+        self.params.append(value)
         return self
     
     def and_where(self, field, operator, value=None):
@@ -166,8 +389,6 @@ class QueryBuilder:
         if not self.where_clauses:
             return self.where(field, operator, value)
         
-        param_name = f"param_{len(self.params)}"
-        
         if value is None:
             value = operator
             operator = "="
@@ -175,23 +396,29 @@ class QueryBuilder:
         # Convert the last condition to use OR
         last_clause = self.where_clauses.pop()
         self.where_clauses.append(f"({last_clause} OR {field} {operator} ?)")
-        self.params[param_name] = value
+        self.params.append(value)
         return self
     
     def where_in(self, field, values):
         """Add a WHERE IN condition"""
+        values = list(values)
         if not values:
             self.where_clauses.append("1 = 0") # Always false
             return self
         
-        param_names = []
-        for value in values:
-            param_name = f"param_{len(self.params)}"
-            param_names.append("?")
-            self.params[param_name] = value
-        
-        placeholders = ", ".join(param_names)
+        placeholders = ", ".join("?" for _ in values)
         self.where_clauses.append(f"{field} IN ({placeholders})")
+        self.params.extend(values)
+        return self
+    
+    def where_between(self, field, low, high):
+        """
+        Add an inclusive WHERE BETWEEN condition. Prefer this over where_in for a
+        run of consecutive integer keys; the range only matches the same rows as
+        an IN list when the column is an integer type.
+        """
+        self.where_clauses.append(f"{field} BETWEEN ? AND ?")
+        self.params.extend([low, high])
         return self
     
     def order_by(self, field, direction="ASC"):
@@ -232,56 +459,28 @@ class QueryBuilder:
         """Add RIGHT JOIN clause"""
         return self.join(table, condition, "RIGHT")
     
-    def build(self):
-        """Build the SQL query"""
-        select_clause = f"SELECT {', '.join(self.select_fields)}"
-        from_clause = f"FROM {self.table_name}"
-        
-        # Add JOIN clauses
-        join_clause = " ".join(self.join_clauses) if self.join_clauses else ""
-        
-        # Add WHERE clause
-        where_clause = ""
-        if self.where_clauses:
-            where_clause = "WHERE " + " AND ".join(self.where_clauses)
-        
-        # Add GROUP BY clause
-        group_by_clause = ""
-        if self.group_by_clauses:
-            group_by_clause = "GROUP BY " + ", ".join(self.group_by_clauses)
-        
-        # Add HAVING clause
-        having_clause = ""
-        if self.having_clauses:
-            having_clause = "HAVING " + " AND ".join(self.having_clauses)
-        
-        # Add ORDER BY clause
-        order_by_clause = ""
-        if self.order_by_clauses:
-            order_by_clause = "ORDER BY " + ", ".join(self.order_by_clauses)
-        
-        # Add LIMIT and OFFSET
-        limit_clause = f"LIMIT {self.limit_value}" if self.limit_value is not None else ""
-        offset_clause = f"OFFSET {self.offset_value}" if self.offset_value is not None else ""
-        
-        # Build the final query
-        clauses = [
-            select_clause,
-            from_clause,
-            join_clause,
-            where_clause,
-            group_by_clause,
-            having_clause,
-            order_by_clause,
-            limit_clause,
-            offset_clause
-        ]
-        
-        query = " ".join(clause for clause in clauses if clause)
-        
-        # Return ordered parameter values instead of the param dict
-        param_values = [self.params[f"param_{i}"] for i in range(len(self.params))]
-        return query, param_values
+    def build(self, select_fields=None):
+        """
+        Build the SQL query. select_fields, if given, replaces the select list for
+        this build only (the builder itself is left unchanged).
+        """
+        if select_fields is None:
+            select_fields = self.select_fields
+        
+        # Clauses only hold ? placeholders, so the SQL text depends on the
+        # query's shape alone and is cached across builders with the same shape
+        sql = _build_select_sql(
+            self.table_name,
+            tuple(select_fields),
+            tuple(self.join_clauses),
+            tuple(self.where_clauses),
+            tuple(self.group_by_clauses),
+            tuple(self.having_clauses),
+            tuple(self.order_by_clauses),
+            self.limit_value,
+            self.offset_value
+        )
+        return sql, list(self.params)
 
 
 class BaseRepository(Generic[T, K]):
@@ -305,6 +504,10 @@ class BaseRepository(Generic[T, K]):
         
         if not self.id_field:
             raise ValueError(f"Entity {self.entity_name} must have an @id_field decorator")
+        
+        # Column layout and SQL statements pre-built by @entity
+        self.descriptor: EntityDescriptor = (self.entity_class.__dict__.get('__entity__')
+                                             or build_entity_descriptor(self.entity_class))
     
     async def init(self, drop_if_exists: bool = False):
         """Initialize the repository - create tables if they don't exist"""
@@ -425,6 +628,18 @@ class BaseRepository(Generic[T, K]):
                     setattr(entity, field_name, value)
         
         return entity
+
+    def _rows_to_entities(self, rows, field_names=None) -> List[T]:
+        """Convert database rows to entities, using the compiled hydrator for full rows"""
+        all_field_names = self.descriptor.field_names
+        hydrate = getattr(self.__class__, '_hydrate', None)
+
+        if (hydrate and rows and isinstance(rows[0], tuple)
+                and len(rows[0]) == len(all_field_names)
+                and (not field_names or tuple(field_names) == all_field_names)):
+            return [hydrate(row) for row in rows]
+
+        return [self._row_to_entity(row, field_names) for row in rows]
     
     async def save(self, entity: T) -> T:
         """Save an entity - insert or update if it exists"""
@@ -482,33 +697,66 @@ class BaseRepository(Generic[T, K]):
         
         # If auto-increment and no ID provided, get one from sequence
         if is_auto_increment and (id_value is None or id_value == 0):
-            seq_result = self.db.execute_and_fetch(f"SELECT nextval('seq_{self.table_name}')")
+            seq_result = await self.db.execute_and_fetch_async(self.descriptor.next_id_sql)
             new_id = seq_result[0][0]
             entity_dict[self.id_field] = new_id
             # Also update the entity object
             setattr(entity, self.id_field, new_id)
         
-        # Now continue with the insert operation as before
-        field_names = []
-        field_placeholders = []
-        param_values = []
+        param_values = [entity_dict[field_name] for field_name in self.descriptor.field_names]
+        await self.db.execute_async(self.descriptor.insert_sql, param_values)
         
-        for field_name in self.entity_meta['fields']:
-            if field_name in entity_dict:
-                field_names.append(field_name)
-                field_placeholders.append("?")
-                param_values.append(entity_dict[field_name])
-        
-        fields_str = ', '.join(field_names)
-        placeholders_str = ', '.join(field_placeholders)
-        
-        if not field_names:
-            raise ValueError("Cannot insert entity with no fields specified")
+        return entity
+
+    async def insert_many(self, entities: List[T]) -> List[T]:
+        """Insert multiple entities with a single multi-row INSERT statement"""
+        if not entities:
+            return []
+
+        id_field_meta = self.entity_meta['fields'].get(self.id_field, {})
+        is_auto_increment = id_field_meta.get('auto_increment', False)
+        field_names = self.descriptor.field_names
+
+        entity_dicts = [self._entity_to_dict(entity) for entity in entities]
+
+        # If auto-increment, draw all missing IDs from the sequence in one query
+        if is_auto_increment:
+            missing = [i for i, entity_dict in enumerate(entity_dicts)
+                       if entity_dict.get(self.id_field) in (None, 0)]
+            if missing:
+                seq_result = await self.db.execute_and_fetch_async(self.descriptor.next_ids_sql,
+                                                                   [len(missing)])
+                for i, (new_id,) in zip(missing, sorted(seq_result)):
+                    entity_dicts[i][self.id_field] = new_id
+                    setattr(entities[i], self.id_field, new_id)
+
+        param_values = []
+        for entity_dict in entity_dicts:
+            param_values.extend(entity_dict[field_name] for field_name in field_names)
+
+        extra_rows = f", {self.descriptor.insert_row_sql}" * (len(entities) - 1)
+        sql = self.descriptor.insert_sql + extra_rows
+        await self.db.execute_async(sql, param_values)
+
+        return entities
+
+    async def bulk_load_dataframe(self, df: 'pd.DataFrame') -> int:
+        """
+        Insert every row of a pandas DataFrame with one INSERT ... SELECT, reading the
+        frame in place through DuckDB instead of building and binding entities.
+        Columns are matched by name; returns the number of rows loaded.
+        """
+        view_name = f"_bulk_load_{self.table_name}_{id(df)}"
+        columns = ', '.join(df.columns)
         
-        sql = f"INSERT INTO {self.table_name} ({fields_str}) VALUES ({placeholders_str})"
-        self.db.execute(sql, param_values)
+        self.db.register(view_name, df)
+        try:
+            sql = f"INSERT INTO {self.table_name} ({columns}) SELECT {columns} FROM {view_name}"
+            await self.db.execute_async(sql)
+        finally:
+            self.db.unregister(view_name)
         
-        return entity
+        return len(df)
     
     async def bulk_insert(self, entities: List[T]) -> List[T]:
         """Insert multiple entities in a single transaction"""
@@ -527,42 +775,51 @@ class BaseRepository(Generic[T, K]):
             self.db.rollback()
             raise e
     
-    async def update(self, entity: T) -> T:
-        """Update an existing entity"""
+    async def update(self, entity: T, *, returning: bool = False) -> Optional[T]:
+        """
+        Update an existing entity. With returning=True the updated row is read back
+        in the same statement and returned as a fresh entity (None if no row matched).
+        """
         entity_dict = self._entity_to_dict(entity)
         id_value = entity_dict[self.id_field]
         
-        field_updates = []
-        param_values = []
-        
-        for field_name, value in entity_dict.items():
-            if field_name != self.id_field:
-                field_updates.append(f"{field_name} = ?")
-                param_values.append(value)
-        
+        param_values = [value for field_name, value in entity_dict.items()
+                        if field_name != self.id_field]
         param_values.append(id_value)
-        updates_str = ', '.join(field_updates)
         
-        sql = f"UPDATE {self.table_name} SET {updates_str} WHERE {self.id_field} = ?"
-        self.db.execute(sql, param_values)
+        if returning:
+            results = await self.db.execute_async(self.descriptor.update_returning_sql, param_values)
+            return self._rows_to_entities(results)[0] if results else None
+        
+        await self.db.execute_async(self.descriptor.update_sql, param_values)
         
         return entity
     
     async def exists_by_id(self, id_value: K) -> bool:
         """Check if an entity exists by ID"""
-        sql = f"SELECT 1 FROM {self.table_name} WHERE {self.id_field} = ? LIMIT 1"
-        result = self.db.execute_and_fetch(sql, [id_value])
+        result = await self.db.execute_and_fetch_async(self.descriptor.exists_by_id_sql, [id_value])
         return len(result) > 0
     
+    async def exists_by_ids(self, id_values: List[K]) -> Dict[K, bool]:
+        """Check which of several IDs exist, using a single query"""
+        if not id_values:
+            return {}
+        
+        placeholders = ", ".join("?" for _ in id_values)
+        sql = f"SELECT {self.id_field} FROM {self.table_name} WHERE {self.id_field} IN ({placeholders})"
+        results = await self.db.execute_and_fetch_async(sql, list(id_values))
+        
+        found = {row[0] for row in results}
+        return {id_value: id_value in found for id_value in id_values}
+    
     async def find_by_id(self, id_value: K) -> Optional[T]:
         """Find an entity by ID"""
-        sql = f"SELECT * FROM {self.table_name} WHERE {self.id_field} = ? LIMIT 1"
-        result = self.db.execute_and_fetch(sql, [id_value])
+        result = await self.db.execute_and_fetch_async(self.descriptor.find_by_id_sql, [id_value])
         
         if not result:
             return None
         
-        return self._row_to_entity(result[0])
+        return self._rows_to_entities(result)[0]
     
     async def find_by_id_or_error(self, id_value: K) -> T:
         """Find an entity by ID or throw an error if not found"""
@@ -573,22 +830,32 @@ class BaseRepository(Generic[T, K]):
     
     async def find_all(self) -> List[T]:
         """Find all entities"""
-        sql = f"SELECT * FROM {self.table_name}"
-        results = self.db.execute_and_fetch(sql)
+        results = await self.db.execute_and_fetch_async(self.descriptor.select_sql)
         
-        return [self._row_to_entity(row) for row in results]
+        return self._rows_to_entities(results)
+    
+    async def find_all_df(self) -> 'pd.DataFrame':
+        """Find all rows as a pandas DataFrame, without building entities"""
+        return await self.db.query_async(self.descriptor.select_sql)
+    
+    async def find_all_arrow(self):
+        """Find all rows as an Arrow table, without building entities"""
+        return await self.db.query_arrow_async(self.descriptor.select_sql)
     
     async def find_all_paged(self, page: int = 1, page_size: int = 10) -> Dict[str, Any]:
         """Find all entities with pagination"""
         offset = (page - 1) * page_size
         
         count_sql = f"SELECT COUNT(*) FROM {self.table_name}"
-        total = self.db.execute_and_fetch(count_sql)[0][0]
-        
         sql = f"SELECT * FROM {self.table_name} LIMIT {page_size} OFFSET {offset}"
-        results = self.db.execute_and_fetch(sql)
         
-        entities = [self._row_to_entity(row) for row in results]
+        count_result, results = await asyncio.gather(
+            self.db.execute_and_fetch_async(count_sql),
+            self.db.execute_and_fetch_async(sql)
+        )
+        total = count_result[0][0]
+        
+        entities = self._rows_to_entities(results)
         
         return {
             "data": entities,
@@ -611,10 +878,10 @@ class BaseRepository(Generic[T, K]):
             query_builder.where(field_name, "=", value)
         
         sql, params = query_builder.build()
-        results = self.db.execute_and_fetch(sql, params)
+        results = await self.db.execute_and_fetch_async(sql, params)
         
         field_names = fields or list(self.entity_meta['fields'].keys())
-        return [self._row_to_entity(row, field_names) for row in results]
+        return self._rows_to_entities(results, field_names)
     
     async def find_one_by(self, criteria: Dict[str, Any]) -> Optional[T]:
         """Find a single entity by criteria"""
@@ -626,12 +893,12 @@ class BaseRepository(Generic[T, K]):
         query_builder.limit(1)
         sql, params = query_builder.build()
         
-        results = self.db.execute_and_fetch(sql, params)
+        results = await self.db.execute_and_fetch_async(sql, params)
         
         if not results:
             return None
         
-        return self._row_to_entity(results[0])
+        return self._rows_to_entities(results)[0]
     
     def query(self) -> QueryBuilder:
         """Get a query builder for complex queries"""
@@ -640,23 +907,28 @@ class BaseRepository(Generic[T, K]):
     async def execute_query(self, query: 'QueryBuilder') -> List[T]:
         """Execute a custom query and return entities"""
         sql, params = query.build()
-        results = self.db.execute_and_fetch(sql, params)
+        results = await self.db.execute_and_fetch_async(sql, params)
         
         # Extract field names from the query's select fields if specified, else use all fields
         field_names = query.select_fields if query.select_fields and query.select_fields[0] != '*' else list(self.entity_meta['fields'].keys())
         
         # Convert rows to entities
-        return [self._row_to_entity(row, field_names) for row in results]
+        return self._rows_to_entities(results, field_names)
+    
+    async def fetch_column(self, query: 'QueryBuilder', column: str) -> List[Any]:
+        """Execute a query selecting only one column and return its values, without building entities"""
+        sql, params = query.build(select_fields=(column,))
+        results = await self.db.execute_and_fetch_async(sql, params)
+        return [row[0] for row in results]
     
     async def execute_raw_query(self, sql: str, params: Dict[str, Any] = None) -> List[T]:
         """Execute a raw SQL query and return entities"""
-        results = self.db.execute_and_fetch(sql, params)
-        return [self._row_to_entity(row) for row in results]
+        results = await self.db.execute_and_fetch_async(sql, params)
+        return self._rows_to_entities(results)
     
     async def remove_by_id(self, id_value: K) -> bool:
         """Remove an entity by ID"""
-        sql = f"DELETE FROM {self.table_name} WHERE {self.id_field} = ?"
-        self.db.execute(sql, [id_value])
+        await self.db.execute_async(self.descriptor.delete_by_id_sql, [id_value])
         return True
     
     async def remove(self, entity: T) -> bool:
@@ -678,12 +950,12 @@ class BaseRepository(Generic[T, K]):
             
             sql = f"DELETE FROM {self.table_name} {where_clause}"
             _, param_values = query_builder.build()
-            self.db.execute(sql, param_values)
+            await self.db.execute_async(sql, param_values)
             # DuckDB doesn't have a way to return the number of deleted rows directly
             return 1  # Assuming success
         else:
             sql = f"DELETE FROM {self.table_name}"
-            self.db.execute(sql)
+            await self.db.execute_async(sql)
             return 1  # Assuming success
     
     async def count(self, criteria: Dict[str, Any] = None) -> int:
@@ -699,7 +971,7 @@ class BaseRepository(Generic[T, K]):
             sql = f"SELECT COUNT(*) as count FROM {self.table_name}"
             params = {}
         
-        result = self.db.execute_and_fetch(sql, params)
+        result = await self.db.execute_and_fetch_async(sql, params)
         return result[0][0]
     
     async def exists(self, criteria: Dict[str, Any]) -> bool:
@@ -708,7 +980,7 @@ class BaseRepository(Generic[T, K]):
         return count > 0
     
     # Data export methods
-    def to_dataframe(self, query_builder: Optional[QueryBuilder] = None) -> pd.DataFrame:
+    def to_dataframe(self, query_builder: Optional[QueryBuilder] = None) -> 'pd.DataFrame':
         """Export query results to a pandas DataFrame"""
         if query_builder:
             sql, params = query_builder.build()
@@ -728,10 +1000,32 @@ class BaseRepository(Generic[T, K]):
         
         return self.db.query_arrow(sql, params)
     
-    async def to_json(self, path=None, query=None, orient='records', **kwargs):
-        """Export entities to JSON"""
-        # The to_dataframe method is synchronous, so don't use await
-        df = self.to_dataframe(query) 
+    async def to_json(self, path=None, query=None, orient='records', use_copy=False, **kwargs):
+        """
+        Export entities to JSON. By default the result is serialized by pandas, so the
+        returned string and the file written to path are identical.
+        
+        With use_copy=True DuckDB writes path directly with COPY ... (FORMAT JSON,
+        ARRAY true), without building a DataFrame, and None is returned. This only
+        supports orient='records' without extra options, and the output follows
+        DuckDB's JSON writer: dates and timestamps as ISO strings, NaN/inf as
+        NaN/Infinity (not strict JSON), and tab-indented rows.
+        """
+        if query:
+            sql, params = query.build()
+        else:
+            sql, params = self.descriptor.select_sql, []
+        
+        if use_copy:
+            if not path or orient != 'records' or kwargs:
+                raise ValueError("use_copy requires a path, orient='records' and no extra options")
+            escaped_path = os.fspath(path).replace("'", "''")
+            copy_sql = f"COPY ({sql}) TO '{escaped_path}' (FORMAT JSON, ARRAY true)"
+            await self.db.execute_async(copy_sql, params)
+            return None
+        
+        # Fetch on a pooled cursor so the event loop isn't blocked
+        df = await self.db.query_async(sql, params)
         
         # Convert DataFrame to JSON
         json_data = df.to_json(orient=orient, **kwargs)
@@ -775,6 +1069,16 @@ class BaseRepository(Generic[T, K]):
             sql = f"SELECT * FROM {self.table_name}"
             params = {}
         
+        if path and set(kwargs) <= {'compression'}:
+            # Let DuckDB write the file directly, without materializing a DataFrame
+            compression = kwargs.get('compression', 'zstd') or 'uncompressed'
+            if str(compression).lower() not in _PARQUET_COMPRESSIONS:
+                raise ValueError(f"Unsupported Parquet compression: {compression!r}")
+            escaped_path = os.fspath(path).replace("'", "''")
+            copy_sql = f"COPY ({sql}) TO '{escaped_path}' (FORMAT PARQUET, COMPRESSION {compression})"
+            await self.db.execute_async(copy_sql, params)
+            return None
+        
         df = self.db.query(sql, params)
         if path:
             df.to_parquet(path, **kwargs)
@@ -806,12 +1110,12 @@ class BaseRepository(Generic[T, K]):
             query = query_builder.limit(batch_size).offset(offset)
             sql, params = query.build()
             
-            batch = self.db.execute_and_fetch(sql, params)
+            batch = await self.db.execute_and_fetch_async(sql, params)
             if not batch:
                 has_more = False
                 break
             
-            entities = [self._row_to_entity(row) for row in batch]
+            entities = self._rows_to_entities(batch)
             
             if processor:
                 result = processor(entities)
@@ -827,7 +1131,7 @@ class BaseRepository(Generic[T, K]):
     async def get_schema(self) -> Dict[str, Any]:
         """Get table schema information"""
         sql = f"PRAGMA table_info({self.table_name})"
-        results = self.db.execute_and_fetch(sql)
+        results = await self.db.execute_and_fetch_async(sql)
         
         schema = []
         for row in results:
@@ -845,13 +1149,13 @@ class BaseRepository(Generic[T, K]):
     async def get_indexes(self) -> List[Dict[str, Any]]:
         """Get table index information"""
         sql = f"PRAGMA index_list({self.table_name})"
-        results = self.db.execute_and_fetch(sql)
+        results = await self.db.execute_and_fetch_async(sql)
         
         indexes = []
         for row in results:
             index_name = row[1]
             index_info_sql = f"PRAGMA index_info({index_name})"
-            index_info = self.db.execute_and_fetch(index_info_sql)
+            index_info = await self.db.execute_and_fetch_async(index_info_sql)
             
             columns = [info[2] for info in index_info]
             
@@ -49,6 +49,7 @@ class ConfigLoader:
         settings = config.get('settings', {})
         load_extensions = config.get('load_extensions', False)
         extensions = config.get('extensions', [])
+        pool_size = int(config.get('pool_size', 4))
         
         return DuckDbConfig(
             name=name,
@@ -56,5 +57,6 @@ class ConfigLoader:
             filename=filename,
             settings=settings,
             load_extensions=load_extensions,
-            extensions=extensions
+            extensions=extensions,
+            pool_size=pool_size
         )
\ No newline at end of file
@@ -1,39 +1,20 @@
-from duckdb_tinyorm_py import entity, field, id_field,BaseRepository, repository, DuckDbConfig, DuckDbLocation
+from duckdb_tinyorm_py import entity, FieldMeta, BaseRepository, repository, DuckDbConfig, DuckDbLocation
 import asyncio
 
 @entity(table_name="courses")
 class Course:
-    def __init__(self, id_=None, name="", department=""):
-        self._id = id_
-        self._name = name
-        self._department = department
+    __slots__ = ('id', 'name', 'department')
 
-    @property
-    @id_field('INTEGER', auto_increment=True)
-    def id(self) -> int:
-        return self._id
-    
-    @id.setter
-    def id(self, value: int):
-        self._id = value
+    _fields = {
+        'id': FieldMeta('INTEGER', is_id=True, auto_increment=True),
+        'name': FieldMeta('VARCHAR', not_null=True),
+        'department': FieldMeta('VARCHAR', not_null=True),
+    }
 
-    @property
-    @field('VARCHAR', not_null=True)
-    def name(self) -> str:
-        return self._name
-        
-    @name.setter
-    def name(self, value: str):
-        self._name = value
-        
-    @property
-    @field('VARCHAR', not_null=True)
-    def department(self) -> str:
-        return self._department
-    
-    @department.setter
-    def department(self, value: str):
-        self._department = value
+    def __init__(self, id_=None, name="", department=""):
+        self.id = id_
+        self.name = name
+        self.department = department
 
 
 
@@ -64,8 +45,10 @@ async def main():
     print(f"Saved course ID: {saved.id}")
     
     # Find entities
-    all_courses = await repo.find_all()
-    cs_courses = await repo.find_by_department("CS")
+    all_courses, cs_courses = await asyncio.gather(
+        repo.find_all(),
+        repo.find_by_department("CS"),
+    )
     
     # Update an entity
     course.name = "Advanced Python"
@@ -79,5 +62,9 @@ async def main():
     json_data = await repo.to_json()
     await repo.to_parquet(path="courses.parquet")
 
-# Run the async code
-asyncio.run(main())
\ No newline at end of file
+# Run the async code on a single event loop
+loop = asyncio.new_event_loop()
+try:
+    loop.run_until_complete(main())
+finally:
+    loop.close()
\ No newline at end of file
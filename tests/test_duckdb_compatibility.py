@@ -1,18 +1,40 @@
 """
-Unit tests for DuckDB 1.x compatibility changes:
-  - QueryBuilder.or_where / where_in use positional ? placeholders
-  - BaseRepository.update / exists_by_id / find_by_id / remove_by_id / remove_all
-    use positional ? placeholders
-  - MigrationManager.apply_migration / revert_migration use positional ? placeholders
+Tests for the ORM against DuckDB 1.x:
+  - Entity metadata: @entity / FieldMeta / slotted entities and the pre-built
+    EntityDescriptor SQL
+  - QueryBuilder SQL generation with positional ? placeholders
+  - DuckDbRepository: pooled cursors for async reads, settings, transactions and
+    shared instances
+  - BaseRepository CRUD, batch inserts, DataFrame bulk loads, columnar results
+    (DataFrame / Arrow) and exports (Parquet / JSON)
+  - MigrationManager apply / revert
 
 All tests run against an in-memory DuckDB database.
 """
 import asyncio
+import functools
+import inspect
+import json
+import math
+import os
+import sys
+import tempfile
 import unittest
+from pathlib import Path
+from unittest import mock
 
 import duckdb
-
-from duckdb_tinyorm_py.decorators import entity, field, id_field, repository
+import pandas as pd
+
+from duckdb_tinyorm_py.decorators import (
+    FieldMeta,
+    build_entity_descriptor,
+    entity,
+    field,
+    get_entity_metadata,
+    id_field,
+    repository,
+)
 from duckdb_tinyorm_py.migration import Migration, MigrationManager
 from duckdb_tinyorm_py.repository import (
     BaseRepository,
@@ -31,57 +53,184 @@ from duckdb_tinyorm_py.repository import (
 class CompatItem:
     """Simple entity used across all repository tests."""
 
+    __slots__ = ("item_id", "name", "category", "score")
+
+    _fields = {
+        "item_id": FieldMeta("INTEGER", is_id=True),
+        "name": FieldMeta("VARCHAR"),
+        "category": FieldMeta("VARCHAR"),
+        "score": FieldMeta("INTEGER"),
+    }
+
     def __init__(self, item_id=None, name="", category="", score=0):
-        self._item_id = item_id
-        self._name = name
-        self._category = category
-        self._score = score
+        self.item_id = item_id
+        self.name = name
+        self.category = category
+        self.score = score
+
+
+@repository(CompatItem)
+class CompatItemRepository(BaseRepository):
+    pass
 
-    @property
-    @id_field("INTEGER")
-    def item_id(self) -> int:
-        return self._item_id
 
-    @item_id.setter
-    def item_id(self, value: int):
-        self._item_id = value
+@entity(table_name="compat_readings")
+class CompatReading:
+    """Entity with DATE and DOUBLE columns for export formatting tests."""
 
-    @property
-    @field("VARCHAR")
-    def name(self) -> str:
-        return self._name
+    __slots__ = ("reading_id", "taken_on", "value")
 
-    @name.setter
-    def name(self, value: str):
-        self._name = value
+    _fields = {
+        "reading_id": FieldMeta("INTEGER", is_id=True),
+        "taken_on": FieldMeta("DATE"),
+        "value": FieldMeta("DOUBLE"),
+    }
 
-    @property
-    @field("VARCHAR")
-    def category(self) -> str:
-        return self._category
+    def __init__(self, reading_id=None, taken_on=None, value=None):
+        self.reading_id = reading_id
+        self.taken_on = taken_on
+        self.value = value
 
-    @category.setter
-    def category(self, value: str):
-        self._category = value
 
-    @property
-    @field("INTEGER")
-    def score(self) -> int:
-        return self._score
+@repository(CompatReading)
+class CompatReadingRepository(BaseRepository):
+    pass
 
-    @score.setter
-    def score(self, value: int):
-        self._score = value
 
+@entity(table_name="compat_events")
+class CompatEvent:
+    """Entity whose id is drawn from a sequence."""
 
-@repository(CompatItem)
-class CompatItemRepository(BaseRepository):
+    __slots__ = ("event_id", "label")
+
+    _fields = {
+        "event_id": FieldMeta("INTEGER", is_id=True, auto_increment=True),
+        "label": FieldMeta("VARCHAR"),
+    }
+
+    def __init__(self, event_id=None, label=""):
+        self.event_id = event_id
+        self.label = label
+
+
+@repository(CompatEvent)
+class CompatEventRepository(BaseRepository):
     pass
 
 
 def _make_db(name: str) -> DuckDbRepository:
-    """Create a fresh in-memory DuckDB instance with a unique name."""
-    return DuckDbRepository(DuckDbConfig(name=name, location=DuckDbLocation.MEMORY))
+    """Return the shared in-memory DuckDB instance for name, opening it on first use."""
+    return DuckDbRepository.get_instance(DuckDbConfig(name=name, location=DuckDbLocation.MEMORY))
+
+
+class SharedLoopTestCase(unittest.TestCase):
+    """TestCase that runs async setup, tests and teardown on one event loop per class.
+
+    Unlike IsolatedAsyncioTestCase, no event loop is created per test method.
+    Coroutine ``test*`` methods are wrapped when the subclass is defined.
+    """
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        for name, member in list(vars(cls).items()):
+            if name.startswith("test") and inspect.iscoroutinefunction(member):
+                setattr(cls, name, cls._run_on_loop(member))
+
+    @staticmethod
+    def _run_on_loop(coro_method):
+        @functools.wraps(coro_method)
+        def wrapper(self, *args, **kwargs):
+            return self.loop.run_until_complete(coro_method(self, *args, **kwargs))
+        return wrapper
+
+    @classmethod
+    def setUpClass(cls):
+        cls.loop = asyncio.new_event_loop()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.loop.run_until_complete(cls.loop.shutdown_asyncgens())
+        cls.loop.close()
+
+    def setUp(self):
+        self.loop.run_until_complete(self.asyncSetUp())
+
+    def tearDown(self):
+        self.loop.run_until_complete(self.asyncTearDown())
+
+    async def asyncSetUp(self):
+        pass
+
+    async def asyncTearDown(self):
+        pass
+
+
+# ---------------------------------------------------------------------------
+# Entity metadata tests
+# ---------------------------------------------------------------------------
+
+class TestEntityMetadata(unittest.TestCase):
+    """Verify field metadata is collected from both supported entity styles."""
+
+    def test_declarative_fields_keep_declaration_order(self):
+        meta = get_entity_metadata(CompatItem)
+        self.assertEqual(list(meta["fields"]), ["item_id", "name", "category", "score"])
+        self.assertEqual(meta["id_field"], "item_id")
+        self.assertTrue(meta["fields"]["item_id"]["is_id"])
+        self.assertEqual(meta["fields"]["score"]["type"], "INTEGER")
+
+    def test_entity_decorator_prebuilds_descriptor(self):
+        desc = CompatItem.__entity__
+        self.assertEqual(desc.field_names, ("item_id", "name", "category", "score"))
+        self.assertEqual(desc.id_index, 0)
+        self.assertEqual(
+            desc.update_sql,
+            "UPDATE compat_items SET name = ?, category = ?, score = ? WHERE item_id = ?",
+        )
+        self.assertEqual(desc.exists_by_id_sql, "SELECT 1 FROM compat_items WHERE item_id = ? LIMIT 1")
+
+    def test_descriptor_sql_is_interned(self):
+        desc = CompatItem.__entity__
+        self.assertIs(desc.exists_by_id_sql, sys.intern("SELECT 1 FROM compat_items WHERE item_id = ? LIMIT 1"))
+        self.assertIs(desc.update_sql, build_entity_descriptor(CompatItem).update_sql)
+
+    def test_repository_compiles_row_hydrator(self):
+        item = CompatItemRepository._hydrate((7, "Eta", "C", 70))
+        self.assertIsInstance(item, CompatItem)
+        self.assertEqual(
+            (item.item_id, item.name, item.category, item.score),
+            (7, "Eta", "C", 70),
+        )
+
+    def test_property_fields_are_still_collected(self):
+        @entity(table_name="legacy_items")
+        class LegacyItem:
+            def __init__(self, legacy_id=None, label=""):
+                self._legacy_id = legacy_id
+                self._label = label
+
+            @property
+            @id_field("INTEGER", auto_increment=True)
+            def legacy_id(self) -> int:
+                return self._legacy_id
+
+            @legacy_id.setter
+            def legacy_id(self, value: int):
+                self._legacy_id = value
+
+            @property
+            @field("VARCHAR", not_null=True)
+            def label(self) -> str:
+                return self._label
+
+            @label.setter
+            def label(self, value: str):
+                self._label = value
+
+        meta = get_entity_metadata(LegacyItem)
+        self.assertEqual(meta["id_field"], "legacy_id")
+        self.assertTrue(meta["fields"]["legacy_id"]["auto_increment"])
+        self.assertTrue(meta["fields"]["label"]["not_null"])
 
 
 # ---------------------------------------------------------------------------
@@ -120,6 +269,11 @@ class TestQueryBuilderPositionalParams(unittest.TestCase):
         self.assertNotIn(":param", sql)
         self.assertEqual(params, [1, 2, 3])
 
+    def test_where_between_uses_positional_placeholders(self):
+        sql, params = QueryBuilder("t").where_between("item_id", 1, 3).build()
+        self.assertIn("item_id BETWEEN ? AND ?", sql)
+        self.assertEqual(params, [1, 3])
+
     def test_where_in_empty_list_produces_always_false(self):
         sql, params = QueryBuilder("t").where_in("item_id", []).build()
         self.assertIn("1 = 0", sql)
@@ -141,6 +295,19 @@ class TestQueryBuilderPositionalParams(unittest.TestCase):
         self.assertIn("x IN (?)", sql)
         self.assertEqual(params, [99])
 
+    def test_build_with_select_fields_overrides_select_list_once(self):
+        qb = QueryBuilder("t").select("a", "b").where("x", "=", 1)
+        sql, params = qb.build(select_fields=("c",))
+        self.assertTrue(sql.startswith("SELECT c FROM t"))
+        self.assertEqual(params, [1])
+        self.assertTrue(qb.build()[0].startswith("SELECT a, b FROM t"))
+
+    def test_same_shape_reuses_cached_sql_with_new_params(self):
+        sql_a, params_a = QueryBuilder("t").where("x", "=", 1).limit(5).build()
+        sql_b, params_b = QueryBuilder("t").where("x", "=", 2).limit(5).build()
+        self.assertIs(sql_a, sql_b)
+        self.assertEqual((params_a, params_b), ([1], [2]))
+
     def test_or_where_sql_executes_against_in_memory_db(self):
         """Generated SQL with ? placeholders must be accepted by DuckDB 1.x.
 
@@ -173,35 +340,171 @@ class TestQueryBuilderPositionalParams(unittest.TestCase):
         rows = con.execute(sql, params).fetchall()
         self.assertEqual(len(rows), 2)
 
+    def test_where_in_matches_exact_values_on_double_column(self):
+        """Consecutive integers must not turn into a range on a non-integer column."""
+        con = duckdb.connect(":memory:")
+        con.execute("CREATE TABLE t (price DOUBLE)")
+        con.execute("INSERT INTO t VALUES (1.0), (1.5), (2.0), (3.0)")
+        for values in ([1, 2, 3], [1, 3, 2]):
+            sql, params = QueryBuilder("t").where_in("price", values).build()
+            rows = con.execute(sql + " ORDER BY price", params).fetchall()
+            self.assertEqual(rows, [(1.0,), (2.0,), (3.0,)])
+
+
+# ---------------------------------------------------------------------------
+# DuckDbRepository async tests (pooled cursors, in-memory DuckDB)
+# ---------------------------------------------------------------------------
+
+class TestDuckDbRepositoryAsync(SharedLoopTestCase):
+    """Verify async fetches run on pooled cursors against the same database."""
+
+    async def asyncSetUp(self):
+        self.db = DuckDbRepository(DuckDbConfig(
+            name=f"pool_compat_{id(self)}", location=DuckDbLocation.MEMORY, pool_size=2
+        ))
+        self.db.execute("CREATE TABLE pool_t (id INTEGER)")
+        self.db.execute("INSERT INTO pool_t VALUES (1), (2), (3)")
+
+    async def asyncTearDown(self):
+        self.db.close()
+
+    async def test_concurrent_fetches_share_the_database(self):
+        results = await asyncio.gather(*[
+            self.db.execute_and_fetch_async("SELECT COUNT(*) FROM pool_t WHERE id >= ?", [i])
+            for i in range(1, 7)
+        ])
+        self.assertEqual([r[0][0] for r in results], [3, 2, 1, 0, 0, 0])
+
+    async def test_execute_async_writes_are_visible_to_pooled_reads(self):
+        await self.db.execute_async("INSERT INTO pool_t VALUES (?)", [4])
+        rows = await self.db.execute_and_fetch_async("SELECT MAX(id) FROM pool_t")
+        self.assertEqual(rows[0][0], 4)
+
+    async def test_concurrent_execute_async_returns_each_callers_rows(self):
+        results = await asyncio.gather(*[
+            self.db.execute_async("INSERT INTO pool_t VALUES (?) RETURNING id", [i])
+            for i in range(10, 70)
+        ])
+        self.assertEqual(results, [[(i,)] for i in range(10, 70)])
+
+    async def test_fetch_inside_transaction_sees_uncommitted_rows(self):
+        self.db.begin_transaction()
+        self.db.execute("INSERT INTO pool_t VALUES (4)")
+        rows = await self.db.execute_and_fetch_async("SELECT COUNT(*) FROM pool_t")
+        self.db.rollback()
+        self.assertEqual(rows[0][0], 4)
+
+    async def test_concurrent_fetches_inside_transaction_return_each_callers_rows(self):
+        self.db.begin_transaction()
+        try:
+            self.db.execute("INSERT INTO pool_t SELECT range FROM range(10, 70)")
+            results = await asyncio.gather(*[
+                self.db.execute_and_fetch_async("SELECT id FROM pool_t WHERE id = ?", [i])
+                for i in range(10, 70)
+            ])
+        finally:
+            self.db.rollback()
+        self.assertEqual(results, [[(i,)] for i in range(10, 70)])
+
+    async def test_fetch_inside_raw_sql_transaction_sees_uncommitted_rows(self):
+        self.db.execute("BEGIN TRANSACTION")
+        self.db.execute("INSERT INTO pool_t VALUES (4)")
+        rows = await self.db.execute_and_fetch_async("SELECT COUNT(*) FROM pool_t")
+        self.db.execute("ROLLBACK")
+        self.assertEqual(rows[0][0], 4)
+        rows = await self.db.execute_and_fetch_async("SELECT COUNT(*) FROM pool_t")
+        self.assertEqual(rows[0][0], 3)
+
+    async def test_pooled_cursors_use_configured_settings(self):
+        db = DuckDbRepository(DuckDbConfig(
+            name=f"pool_settings_{id(self)}", location=DuckDbLocation.MEMORY, pool_size=2,
+            settings={"TimeZone": "'America/New_York'", "search_path": "'memory.main'"}
+        ))
+        try:
+            sql = "SELECT current_setting('TimeZone'), current_setting('search_path')"
+            expected = [("America/New_York", "memory.main")]
+            self.assertEqual(db.execute_and_fetch(sql), expected)
+            results = await asyncio.gather(*[db.execute_and_fetch_async(sql) for _ in range(4)])
+            self.assertEqual(results, [expected] * 4)
+        finally:
+            db.close()
+
+    async def test_make_db_shares_one_handle_per_name(self):
+        shared = _make_db("pool_compat_shared")
+        try:
+            self.assertIs(_make_db("pool_compat_shared"), shared)
+        finally:
+            shared.close()
+        reopened = _make_db("pool_compat_shared")
+        try:
+            self.assertIsNot(reopened, shared)
+            self.assertIsNotNone(reopened.con)
+        finally:
+            reopened.close()
+
 
 # ---------------------------------------------------------------------------
 # BaseRepository tests (async, in-memory DuckDB)
 # ---------------------------------------------------------------------------
 
-class TestBaseRepositoryCompatibility(unittest.IsolatedAsyncioTestCase):
+class TestBaseRepositoryCompatibility(SharedLoopTestCase):
     """Integration tests for BaseRepository with an in-memory DuckDB database."""
 
-    async def asyncSetUp(self):
-        self.db = _make_db(f"repo_compat_{id(self)}")
-        self.repo = CompatItemRepository(self.db)
-        await self.repo.init(drop_if_exists=True)
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # One database per class; each test runs inside a transaction that is
+        # rolled back afterwards, so the seeded rows are shared by every test.
+        cls.db = _make_db(f"repo_compat_{cls.__name__}")
+        cls.repo = CompatItemRepository(cls.db)
+
+        async def _seed():
+            await cls.repo.init(drop_if_exists=True)
+            await cls.repo.bulk_load_dataframe(pd.DataFrame({
+                "item_id": [1, 2, 3],
+                "name": ["Alpha", "Beta", "Gamma"],
+                "category": ["A", "B", "A"],
+                "score": [10, 20, 30],
+            }))
+
+        cls.loop.run_until_complete(_seed())
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.db.close()
+        super().tearDownClass()
 
-        # Seed three rows
-        await self.repo.insert(CompatItem(item_id=1, name="Alpha", category="A", score=10))
-        await self.repo.insert(CompatItem(item_id=2, name="Beta",  category="B", score=20))
-        await self.repo.insert(CompatItem(item_id=3, name="Gamma", category="A", score=30))
+    async def asyncSetUp(self):
+        self.db.begin_transaction()
 
     async def asyncTearDown(self):
-        self.db.close()
+        self.db.rollback()
 
     # --- exists_by_id ---
 
+    async def test_exists_by_id_sees_insert_in_raw_sql_transaction(self):
+        # asyncSetUp already opened a transaction; end it and open one by hand
+        self.db.rollback()
+        self.db.execute("BEGIN TRANSACTION")
+        await self.repo.insert(CompatItem(item_id=50, name="Raw", category="C", score=5))
+        self.assertTrue(await self.repo.exists_by_id(50))
+        self.db.execute("ROLLBACK")
+        self.assertFalse(await self.repo.exists_by_id(50))
+        self.db.begin_transaction()
+
     async def test_exists_by_id_returns_true_for_existing(self):
         self.assertTrue(await self.repo.exists_by_id(1))
 
     async def test_exists_by_id_returns_false_for_missing(self):
         self.assertFalse(await self.repo.exists_by_id(999))
 
+    async def test_exists_by_ids_reports_each_id(self):
+        existing = await self.repo.exists_by_ids([1, 999, 3])
+        self.assertEqual(existing, {1: True, 999: False, 3: True})
+
+    async def test_exists_by_ids_with_empty_list(self):
+        self.assertEqual(await self.repo.exists_by_ids([]), {})
+
     # --- find_by_id ---
 
     async def test_find_by_id_returns_correct_entity(self):
@@ -214,18 +517,73 @@ class TestBaseRepositoryCompatibility(unittest.IsolatedAsyncioTestCase):
         item = await self.repo.find_by_id(999)
         self.assertIsNone(item)
 
+    # --- insert_many ---
+
+    async def test_insert_many_persists_all_rows(self):
+        await self.repo.insert_many([
+            CompatItem(item_id=4, name="Delta", category="B", score=40),
+            CompatItem(item_id=5, name="Epsilon", category="C", score=50),
+        ])
+        self.assertEqual(await self.repo.count(), 5)
+        item = await self.repo.find_by_id(5)
+        self.assertEqual(item.name, "Epsilon")
+        self.assertEqual(item.score, 50)
+
+    async def test_insert_many_draws_auto_increment_ids_in_one_query(self):
+        events = CompatEventRepository(self.db)
+        await events.init(drop_if_exists=True)
+        fetch = self.db.execute_and_fetch_async
+        with mock.patch.object(self.db, "execute_and_fetch_async", wraps=fetch) as spy:
+            inserted = await events.insert_many([CompatEvent(label=label) for label in ("a", "b", "c")])
+        self.assertEqual(spy.call_count, 1)
+        ids = [event.event_id for event in inserted]
+        self.assertEqual(len(set(ids)), 3)
+        rows = self.db.execute_and_fetch("SELECT event_id, label FROM compat_events ORDER BY event_id")
+        self.assertEqual(rows, list(zip(ids, ["a", "b", "c"])))
+
+    async def test_insert_many_with_empty_list_is_noop(self):
+        self.assertEqual(await self.repo.insert_many([]), [])
+        self.assertEqual(await self.repo.count(), 3)
+
+    # --- bulk_load_dataframe ---
+
+    async def test_bulk_load_dataframe_inserts_rows_by_column_name(self):
+        loaded = await self.repo.bulk_load_dataframe(pd.DataFrame({
+            "score": [40, 50],
+            "item_id": [4, 5],
+            "name": ["Delta", "Epsilon"],
+            "category": ["B", "C"],
+        }))
+        self.assertEqual(loaded, 2)
+        item = await self.repo.find_by_id(4)
+        self.assertEqual((item.name, item.category, item.score), ("Delta", "B", 40))
+        self.assertEqual(await self.repo.count(), 5)
+
     # --- update ---
 
     async def test_update_persists_changes(self):
         item = await self.repo.find_by_id(1)
         item.name = "AlphaUpdated"
         item.score = 99
-        await self.repo.update(item)
+        updated = await self.repo.update(item, returning=True)
 
-        updated = await self.repo.find_by_id(1)
         self.assertEqual(updated.name, "AlphaUpdated")
         self.assertEqual(updated.score, 99)
 
+    async def test_concurrent_returning_updates_return_their_own_entity(self):
+        ids = range(10, 50)
+        await self.repo.insert_many([CompatItem(item_id=i, name=f"n{i}", category="C") for i in ids])
+        updated = await asyncio.gather(*[
+            self.repo.update(CompatItem(item_id=i, name=f"u{i}", category="C", score=i), returning=True)
+            for i in ids
+        ])
+        self.assertEqual([(u.item_id, u.name, u.score) for u in updated],
+                         [(i, f"u{i}", i) for i in ids])
+
+    async def test_update_returning_missing_row_returns_none(self):
+        missing = CompatItem(item_id=999, name="Nobody", category="Z", score=0)
+        self.assertIsNone(await self.repo.update(missing, returning=True))
+
     async def test_update_does_not_affect_other_rows(self):
         item = await self.repo.find_by_id(1)
         item.name = "AlphaUpdated"
@@ -242,15 +600,15 @@ class TestBaseRepositoryCompatibility(unittest.IsolatedAsyncioTestCase):
 
     async def test_remove_by_id_does_not_delete_other_rows(self):
         await self.repo.remove_by_id(1)
-        self.assertTrue(await self.repo.exists_by_id(2))
-        self.assertTrue(await self.repo.exists_by_id(3))
+        existing = await self.repo.exists_by_ids([2, 3])
+        self.assertEqual(existing, {2: True, 3: True})
 
     # --- remove_all with criteria ---
 
     async def test_remove_all_with_criteria_deletes_matching_rows(self):
         await self.repo.remove_all({"category": "A"})
-        self.assertFalse(await self.repo.exists_by_id(1))
-        self.assertFalse(await self.repo.exists_by_id(3))
+        existing = await self.repo.exists_by_ids([1, 3])
+        self.assertEqual(existing, {1: False, 3: False})
 
     async def test_remove_all_with_criteria_preserves_non_matching_rows(self):
         await self.repo.remove_all({"category": "A"})
@@ -261,6 +619,105 @@ class TestBaseRepositoryCompatibility(unittest.IsolatedAsyncioTestCase):
         total = await self.repo.count()
         self.assertEqual(total, 0)
 
+    # --- columnar results ---
+
+    async def test_find_all_df_returns_all_rows(self):
+        df = await self.repo.find_all_df()
+        self.assertEqual(sorted(df["item_id"].tolist()), [1, 2, 3])
+        self.assertEqual(list(df.columns), ["item_id", "name", "category", "score"])
+
+    async def test_find_all_arrow_returns_table(self):
+        table = await self.repo.find_all_arrow()
+        self.assertEqual(table.num_rows, 3)
+        self.assertEqual(sorted(table.column("name").to_pylist()), ["Alpha", "Beta", "Gamma"])
+
+    # --- export ---
+
+    async def test_to_parquet_writes_query_results_to_path(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "items.parquet")
+            await self.repo.to_parquet(self.repo.query().where("category", "=", "A"), path=path)
+            rows = duckdb.connect().execute(
+                "SELECT item_id FROM read_parquet(?) ORDER BY item_id", [path]
+            ).fetchall()
+        self.assertEqual(rows, [(1,), (3,)])
+
+    async def test_to_parquet_rejects_unknown_compression(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "items.parquet")
+            with self.assertRaises(ValueError):
+                await self.repo.to_parquet(path=path, compression="zstd); DROP TABLE compat_items; --")
+            self.assertFalse(os.path.exists(path))
+        self.assertEqual(await self.repo.count(), 3)
+
+    async def test_to_parquet_accepts_pathlib_path(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "items.parquet"
+            await self.repo.to_parquet(path=path)
+            rows = duckdb.connect().execute(
+                "SELECT COUNT(*) FROM read_parquet(?)", [str(path)]
+            ).fetchall()
+        self.assertEqual(rows, [(3,)])
+
+    async def test_to_json_with_path_writes_records(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "items.json")
+            json_data = await self.repo.to_json(path=path, query=self.repo.query().where("item_id", "=", 2))
+            with open(path) as f:
+                written = json.load(f)
+        self.assertEqual(json.loads(json_data), written)
+        self.assertEqual(written, [{"item_id": 2, "name": "Beta", "category": "B", "score": 20}])
+
+    async def _init_readings(self):
+        readings = CompatReadingRepository(self.db)
+        await readings.init(drop_if_exists=True)
+        self.db.execute(
+            "INSERT INTO compat_readings VALUES (1, DATE '2024-01-01', 'NaN'::DOUBLE), (2, NULL, 'inf'::DOUBLE)"
+        )
+        return readings
+
+    async def test_to_json_path_and_return_value_use_same_serialization(self):
+        readings = await self._init_readings()
+        returned = await readings.to_json(date_format="iso")
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "readings.json")
+            written = await readings.to_json(path=path, date_format="iso")
+            with open(path) as f:
+                file_contents = f.read()
+        self.assertEqual(written, returned)
+        self.assertEqual(file_contents, returned)
+        self.assertEqual(json.loads(returned), [
+            {"reading_id": 1, "taken_on": "2024-01-01T00:00:00.000", "value": None},
+            {"reading_id": 2, "taken_on": None, "value": None},
+        ])
+
+    async def test_to_json_use_copy_writes_file_with_duckdb(self):
+        readings = await self._init_readings()
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "readings.json"
+            self.assertIsNone(await readings.to_json(path=path, use_copy=True))
+            written = json.loads(path.read_text())
+        self.assertEqual(written[0]["taken_on"], "2024-01-01")
+        self.assertTrue(math.isnan(written[0]["value"]))
+        self.assertEqual(written[1]["value"], float("inf"))
+
+    async def test_to_json_use_copy_rejects_unsupported_options(self):
+        with self.assertRaises(ValueError):
+            await self.repo.to_json(use_copy=True)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "items.json")
+            with self.assertRaises(ValueError):
+                await self.repo.to_json(path=path, orient="columns", use_copy=True)
+            with self.assertRaises(ValueError):
+                await self.repo.to_json(path=path, use_copy=True, date_format="iso")
+
+    async def test_to_json_accepts_pathlib_path(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "items.json"
+            json_data = await self.repo.to_json(path=path)
+            self.assertEqual(path.read_text(), json_data)
+        self.assertEqual(len(json.loads(json_data)), 3)
+
     # --- execute_query with QueryBuilder (or_where / where_in) ---
 
     async def test_execute_query_with_or_where(self):
@@ -269,18 +726,22 @@ class TestBaseRepositoryCompatibility(unittest.IsolatedAsyncioTestCase):
             .where("category", "=", "B")
             .or_where("name", "=", "Gamma")
         )
-        results = await self.repo.execute_query(qb)
-        names = {r.name for r in results}
+        names = set(await self.repo.fetch_column(qb, "name"))
         self.assertIn("Beta", names)
         self.assertIn("Gamma", names)
         self.assertNotIn("Alpha", names)
 
     async def test_execute_query_with_where_in(self):
         qb = self.repo.query().where_in("item_id", [1, 3])
-        results = await self.repo.execute_query(qb)
-        ids = {r.item_id for r in results}
+        ids = set(await self.repo.fetch_column(qb, "item_id"))
         self.assertEqual(ids, {1, 3})
 
+    async def test_execute_query_returns_entities(self):
+        qb = self.repo.query().where("category", "=", "A").order_by("item_id")
+        results = await self.repo.execute_query(qb)
+        self.assertEqual([r.name for r in results], ["Alpha", "Gamma"])
+        self.assertIsInstance(results[0], CompatItem)
+
 
 # ---------------------------------------------------------------------------
 # MigrationManager tests (async, in-memory DuckDB)
@@ -299,17 +760,29 @@ class _CreateTableMigration(Migration):
         db.execute("DROP TABLE IF EXISTS migration_test_tbl")
 
 
-class TestMigrationManagerCompatibility(unittest.IsolatedAsyncioTestCase):
+class TestMigrationManagerCompatibility(SharedLoopTestCase):
     """Integration tests for MigrationManager with an in-memory DuckDB database."""
 
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.db = _make_db(f"mig_compat_{cls.__name__}")
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.db.close()
+        super().tearDownClass()
+
     async def asyncSetUp(self):
-        self.db = _make_db(f"mig_compat_{id(self)}")
+        # MigrationManager manages its own transactions, so reset state by
+        # recreating the migrations table and dropping the tables tests create.
+        self.db.execute("DROP TABLE IF EXISTS _migrations")
+        self.db.execute("DROP SEQUENCE IF EXISTS seq__migrations")
+        self.db.execute("DROP TABLE IF EXISTS migration_test_tbl")
+        self.db.execute("DROP TABLE IF EXISTS mig2_tbl")
         self.manager = MigrationManager(self.db)
         await self.manager.init()
 
-    async def asyncTearDown(self):
-        self.db.close()
-
     async def test_get_applied_migrations_initially_empty(self):
         migrations = await self.manager.get_applied_migrations()
         self.assertEqual(migrations, [])
@@ -381,6 +854,39 @@ class TestMigrationManagerCompatibility(unittest.IsolatedAsyncioTestCase):
         applied = await self.manager.get_applied_migrations()
         self.assertEqual(applied, [])
 
+    async def test_apply_migrations_batch_skips_already_applied(self):
+        await self.manager.apply_migration(_CreateTableMigration())
+        count = await self.manager.apply_migrations([_CreateTableMigration()])
+        self.assertEqual(count, 0)
+        applied = await self.manager.get_applied_migrations()
+        self.assertEqual(len(applied), 1)
+
+    async def test_apply_migrations_batch_rolls_back_on_failure(self):
+        class _FailingMig(Migration):
+            def __init__(self):
+                super().__init__("failing_migration", "9.0.0")
+            async def up(self, db):
+                db.execute("CREATE TABLE broken_tbl (id NOT_A_TYPE)")
+
+        with self.assertRaises(Exception):
+            await self.manager.apply_migrations([_CreateTableMigration(), _FailingMig()])
+        applied = await self.manager.get_applied_migrations()
+        self.assertEqual(applied, [])
+
+    async def test_migration_can_seed_rows_with_executemany(self):
+        class _SeedMig(Migration):
+            def __init__(self):
+                super().__init__("seed_migration", "3.0.0")
+            async def up(self, db):
+                db.execute("CREATE TABLE IF NOT EXISTS migration_test_tbl (id INTEGER)")
+                db.executemany("INSERT INTO migration_test_tbl VALUES (?)", [[i] for i in range(5)])
+            async def down(self, db):
+                db.execute("DROP TABLE IF EXISTS migration_test_tbl")
+
+        await self.manager.apply_migration(_SeedMig())
+        rows = self.db.execute_and_fetch("SELECT COUNT(*) FROM migration_test_tbl")
+        self.assertEqual(rows[0][0], 5)
+
 
 if __name__ == "__main__":
     unittest.main()